@@ -1,14 +1,16 @@
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import numpy as np
 import pandas as pd
-import psycopg2
-from psycopg2 import Error
-from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+import psycopg
+from psycopg import Error
+from psycopg.conninfo import make_conninfo
+from psycopg_pool import ConnectionPool
 import logging
-from datetime import datetime
 import re
 import os
-from typing import Optional, Tuple, Any, Set
+from typing import Optional, Tuple, Any, Set, List
 import sys
-import time
 
 # Configure logging
 logging.basicConfig(
@@ -20,6 +22,77 @@ logging.basicConfig(
     ]
 )
 
+# Validation patterns, kept in sync with the CHECK constraints added after bulk loading
+_NAME_RE = re.compile(r'^[A-Za-z]+$')
+_QUARTER_RE = re.compile(r'^[0-9]{2}[A-Z]{2}[0-9]{4}$')
+_EMAIL_RE = re.compile(r'^[a-zA-Z]+[.][a-zA-Z]+@sail[.]bokaro[.]com$')
+_PHONE_RE = re.compile(r'^[0-9]{10}$')
+_IFSC_RE = re.compile(r'^[A-Z]{4}[0-9]{5,}$')
+_ACCT_RE = re.compile(r'^[0-9]{1,20}$')
+
+# Column order used when bulk loading each table
+EMPLOYEE_COLUMNS = [
+    'employee_id', 'first_name', 'last_name', 'designation',
+    'department', 'grade', 'date_of_joining', 'quarter_no',
+    'email_id', 'phone_number', 'account_number', 'ifsc_code',
+    'branch_name', 'bank_name', 'shop'
+]
+
+PAY_COLUMNS = [
+    'pay_id', 'employee_id', 'base_salary', 'ta', 'da', 'hra',
+    'stocks', 'vacation_tour', 'uniform_allowance',
+    'medical_benefits', 'bonus_amount', 'other_allowances',
+    'income_tax'
+]
+
+# Column types for reading the pay structure CSV
+PAY_CSV_DTYPES = {
+    'pay_id': 'int64', 'employee_id': 'int64', 'base_salary': 'float64',
+    'ta': 'float64', 'da': 'float64', 'hra': 'float64',
+    'stocks': 'float64', 'vacation_tour': 'float64', 'uniform_allowance': 'float64',
+    'medical_benefits': 'float64', 'bonus_amount': 'float64', 'other_allowances': 'float64'
+}
+
+PAY_INDEX = {column: i for i, column in enumerate(PAY_COLUMNS)}
+
+# Column types for tables bulk loaded with binary COPY. pay_structure stays on
+# text COPY: its NUMERIC columns would need a Python Decimal per cell, and
+# psycopg's binary numeric dumper is slower than letting the server parse text
+COPY_TYPES = {
+    'employees': [
+        'int4', 'varchar', 'varchar', 'varchar',
+        'varchar', 'varchar', 'date', 'varchar',
+        'varchar', 'varchar', 'varchar', 'varchar',
+        'varchar', 'varchar', 'varchar'
+    ]
+}
+
+def employee_field_errors(df: pd.DataFrame) -> pd.Series:
+    """Return the first field error for each employee row, or None when the row is valid"""
+    employee_id = pd.to_numeric(df['employee_id'], errors='coerce')
+    quarter_no = df['quarter_no'].astype(str)
+
+    # Checks in the order they are reported
+    checks = [
+        ('employee_id', employee_id.between(1000000, 9999999)),
+        ('first_name', df['first_name'].astype(str).str.match(_NAME_RE)),
+        ('last_name', df['last_name'].astype(str).str.match(_NAME_RE)),
+        ('date_of_joining', pd.to_datetime(
+            df['date_of_joining'].astype(str), format='%Y-%m-%d', errors='coerce'
+        ).notna()),
+        ('quarter_no', (quarter_no == 'NA') | quarter_no.str.match(_QUARTER_RE)),
+        ('email_id', df['email_id'].astype(str).str.match(_EMAIL_RE)),
+        ('phone_number', df['phone_number'].astype(str).str.match(_PHONE_RE)),
+        ('ifsc_code', df['ifsc_code'].astype(str).str.match(_IFSC_RE)),
+        ('account_number', df['account_number'].astype(str).str.match(_ACCT_RE))
+    ]
+
+    errors = pd.Series(None, index=df.index, dtype=object)
+    for field, is_valid in reversed(checks):
+        errors[~is_valid] = f"Invalid {field}: " + df.loc[~is_valid, field].astype(str)
+
+    return errors
+
 class DatabaseManager:
     def __init__(self, host: str, user: str, password: str, port: str = "5432"):
         """Initialize DatabaseManager with connection parameters"""
@@ -30,21 +103,55 @@ class DatabaseManager:
         self.db_name = "employeedb"
         self.conn = None
         self.cur = None
-        self.max_retries = 5
-        self.retry_delay = 3
+        self.conn_pool = None
+        self.connect_timeout = 30.0
+        self.use_copy = True
+        self.copy_batch_size = 10000
+        self.insert_batch_size = 1000
         self.successful_employee_ids = set()
+        self.rejected_rows = []
+        self.rejects_file = 'rejected_rows.csv'
+        self.rejects_log_sample = 20
+        self.validation_workers = os.cpu_count() or 1
+        self.parallel_validation_rows = 100000
+
+        # Pools are created up front but only connect when opened
+        self.admin_pool = ConnectionPool(
+            self.conninfo("postgres"),
+            min_size=1,
+            max_size=4,
+            kwargs={"autocommit": True},
+            open=False
+        )
+        self.pool = ConnectionPool(
+            self.conninfo(self.db_name),
+            min_size=1,
+            max_size=4,
+            # Switch repeated statements to server-side prepared statements
+            kwargs={"autocommit": True, "prepare_threshold": 5},
+            open=False
+        )
+
+    def conninfo(self, dbname: str) -> str:
+        """Build a connection string for the given database"""
+        return make_conninfo(
+            host=self.host,
+            user=self.user,
+            password=self.password,
+            port=self.port,
+            dbname=dbname
+        )
 
     def connect_to_default_db(self) -> None:
         """Connect to default postgres database to create our new database"""
         try:
-            self.conn = psycopg2.connect(
-                host=self.host,
-                user=self.user,
-                password=self.password,
-                port=self.port,
-                database="postgres"
-            )
-            self.conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+            # Probe with a single connection first: the pool would keep retrying a bad password
+            # or unknown host until its timeout and only log the server's message
+            with psycopg.connect(self.conninfo("postgres"), connect_timeout=int(self.connect_timeout)):
+                pass
+            self.admin_pool.open(wait=True, timeout=self.connect_timeout)
+            self.conn = self.admin_pool.getconn()
+            self.conn_pool = self.admin_pool
             self.cur = self.conn.cursor()
             logging.info("Successfully connected to default database")
         except Error as e:
@@ -70,11 +177,8 @@ class DatabaseManager:
             self.cur.execute(f'CREATE DATABASE "{self.db_name}"')
             logging.info(f"Database {self.db_name} created successfully")
             
-            # Close current connection
-            self.cleanup()
-            
-            # Wait for database to be ready
-            time.sleep(5)
+            # Return current connection to the pool
+            self.release_connection()
             
         except Error as e:
             logging.error(f"Error creating database: {e}")
@@ -83,14 +187,8 @@ class DatabaseManager:
     def verify_database_exists(self) -> bool:
         """Verify that the database exists"""
         try:
-            with psycopg2.connect(
-                host=self.host,
-                user=self.user,
-                password=self.password,
-                port=self.port,
-                database="postgres"
-            ) as temp_conn:
-                temp_conn.autocommit = True
+            self.admin_pool.open(wait=True, timeout=self.connect_timeout)
+            with self.admin_pool.connection() as temp_conn:
                 with temp_conn.cursor() as temp_cur:
                     temp_cur.execute("SELECT 1 FROM pg_database WHERE datname = %s", (self.db_name,))
                     exists = temp_cur.fetchone() is not None
@@ -107,51 +205,39 @@ class DatabaseManager:
             return False
 
     def connect_to_psu_db(self) -> None:
-        """Connect to the employeedb database with retry logic"""
+        """Connect to the employeedb database, waiting for the pool to come up"""
         if not self.verify_database_exists():
             raise Exception(f"Database {self.db_name} does not exist")
             
-        for attempt in range(self.max_retries):
-            try:
-                self.conn = psycopg2.connect(
-                    host=self.host,
-                    user=self.user,
-                    password=self.password,
-                    port=self.port,
-                    database=self.db_name
-                )
-                self.conn.autocommit = True
-                self.cur = self.conn.cursor()
-                logging.info(f"Successfully connected to {self.db_name}")
-                return
-            except Error as e:
-                if attempt < self.max_retries - 1:
-                    wait_time = self.retry_delay * (attempt + 1)
-                    logging.warning(f"Connection attempt {attempt + 1} failed, retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
-                else:
-                    logging.error(f"Error connecting to {self.db_name} after {self.max_retries} attempts: {e}")
-                    raise
+        try:
+            # The pool keeps retrying with backoff until its first connection succeeds
+            self.pool.open(wait=True, timeout=self.connect_timeout)
+            self.conn = self.pool.getconn()
+            self.conn_pool = self.pool
+            self.cur = self.conn.cursor()
+            logging.info(f"Successfully connected to {self.db_name}")
+        except Error as e:
+            logging.error(f"Error connecting to {self.db_name} within {self.connect_timeout} seconds: {e}")
+            raise
 
-    def create_tables(self) -> None:
-        """Create the necessary tables with constraints"""
+    def create_base_tables(self) -> None:
+        """Create the necessary tables with their keys and CHECK constraints"""
         try:
             # Create Employees table
             self.cur.execute("""
                 CREATE TABLE IF NOT EXISTS employees (
                     employee_id INTEGER PRIMARY KEY CHECK (employee_id BETWEEN 1000000 AND 9999999),
-                    first_name VARCHAR(50) NOT NULL CHECK (first_name ~ '^[A-Za-z]+$'),
-                    last_name VARCHAR(50) NOT NULL CHECK (last_name ~ '^[A-Za-z]+$'),
+                    first_name VARCHAR(50) NOT NULL,
+                    last_name VARCHAR(50) NOT NULL,
                     designation VARCHAR(50) NOT NULL,
                     department VARCHAR(50) NOT NULL,
                     grade VARCHAR(10) DEFAULT 'NA',
                     date_of_joining DATE NOT NULL,
-                    quarter_no VARCHAR(10) DEFAULT 'NA' CHECK (quarter_no ~ '^[0-9]{2}[A-Z]{2}[0-9]{4}$' OR quarter_no = 'NA'),
-                    email_id VARCHAR(100) NOT NULL UNIQUE 
-                        CHECK (email_id ~ '^[a-zA-Z]+[.][a-zA-Z]+@sail[.]bokaro[.]com$'),
-                    phone_number VARCHAR(10) NOT NULL CHECK (phone_number ~ '^[0-9]{10}$'),
-                    account_number VARCHAR(20) NOT NULL CHECK (account_number ~ '^[0-9]{1,20}$'),
-                    ifsc_code VARCHAR(20) NOT NULL CHECK (ifsc_code ~ '^[A-Z]{4}[0-9]{5,}$'),
+                    quarter_no VARCHAR(10) DEFAULT 'NA',
+                    email_id VARCHAR(100) NOT NULL,
+                    phone_number VARCHAR(10) NOT NULL,
+                    account_number VARCHAR(20) NOT NULL,
+                    ifsc_code VARCHAR(20) NOT NULL,
                     branch_name VARCHAR(50) NOT NULL,
                     bank_name VARCHAR(50) NOT NULL,
                     shop VARCHAR(50) NOT NULL
@@ -176,178 +262,278 @@ class DatabaseManager:
                     employee_pf NUMERIC(10,2) GENERATED ALWAYS AS (base_salary * 0.125) STORED,
                     employer_pf NUMERIC(10,2) GENERATED ALWAYS AS (base_salary * 0.125) STORED,
                     total_pf NUMERIC(10,2) GENERATED ALWAYS AS (base_salary * 0.25) STORED,
-                    income_tax NUMERIC(10,2),
-                    monthly_salary NUMERIC(10,2) GENERATED ALWAYS AS (
-                        base_salary + 
-                        COALESCE(ta, 0) + 
-                        COALESCE(da, 0) + 
-                        COALESCE(hra, 0) + 
-                        COALESCE(uniform_allowance, 0) - 
-                        (base_salary * 0.125) -  -- Subtract employee PF
-                        COALESCE(income_tax, 0)  -- Subtract income tax
-                    ) STORED
+                    income_tax NUMERIC(10,2)
+                    -- monthly_salary is derived in employee_summary rather than stored
                 )
             """)
 
-            # Create indexes for frequent queries
-            self.cur.execute("""
-                CREATE INDEX IF NOT EXISTS idx_employee_email ON employees(email_id);
-                CREATE INDEX IF NOT EXISTS idx_employee_department ON employees(department);
-                CREATE INDEX IF NOT EXISTS idx_pay_employee_id ON pay_structure(employee_id);
-            """)
-
-            # Create function to calculate income tax
+            # Create function to calculate income tax; plain SQL and IMMUTABLE so the
+            # planner can inline it and run it in parallel plans
             self.cur.execute("""
                 CREATE OR REPLACE FUNCTION calculate_income_tax(annual_income NUMERIC)
                 RETURNS NUMERIC AS $$
-                DECLARE
-                    tax NUMERIC := 0;
-                BEGIN
-                    -- New tax regime 2023-24
-                    IF annual_income <= 300000 THEN
-                        tax := 0;
-                    ELSIF annual_income <= 600000 THEN
-                        tax := (annual_income - 300000) * 0.05;
-                    ELSIF annual_income <= 900000 THEN
-                        tax := 15000 + (annual_income - 600000) * 0.10;
-                    ELSIF annual_income <= 1200000 THEN
-                        tax := 45000 + (annual_income - 900000) * 0.15;
-                    ELSIF annual_income <= 1500000 THEN
-                        tax := 90000 + (annual_income - 1200000) * 0.20;
-                    ELSE
-                        tax := 150000 + (annual_income - 1500000) * 0.30;
-                    END IF;
-                    
-                    -- Return monthly tax
-                    RETURN ROUND(tax / 12, 2);
-                END;
-                $$ LANGUAGE plpgsql;
+                    -- New tax regime 2023-24, returned as monthly tax
+                    SELECT ROUND(
+                        CASE
+                            WHEN annual_income <= 300000 THEN 0
+                            WHEN annual_income <= 600000 THEN (annual_income - 300000) * 0.05
+                            WHEN annual_income <= 900000 THEN 15000 + (annual_income - 600000) * 0.10
+                            WHEN annual_income <= 1200000 THEN 45000 + (annual_income - 900000) * 0.15
+                            WHEN annual_income <= 1500000 THEN 90000 + (annual_income - 1200000) * 0.20
+                            ELSE 150000 + (annual_income - 1500000) * 0.30
+                        END / 12, 2
+                    );
+                $$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
             """)
 
-            logging.info("Tables, indexes, and functions created successfully")
+            logging.info("Tables and functions created successfully")
         except Error as e:
             logging.error(f"Error creating tables: {e}")
             raise
 
-    def validate_ifsc_code(self, ifsc_code: str) -> bool:
-        """Validate IFSC code format"""
-        if pd.isna(ifsc_code):
-            return False
-        ifsc_code = str(ifsc_code).strip()
-        return bool(re.match(r'^[A-Z]{4}[0-9]{5,}$', ifsc_code))
-
-    def validate_employee_data(self, row: pd.Series) -> Tuple[bool, Optional[str]]:
-        """Validate employee data before insertion"""
+    def add_check_constraints(self) -> None:
+        """Add the employee format CHECK constraints (run after bulk loading)"""
         try:
-            # Validate employee_id
-            if not (1000000 <= int(row['employee_id']) <= 9999999):
-                return False, f"Invalid employee_id: {row['employee_id']}"
-
-            # Validate names
-            if not re.match(r'^[A-Za-z]+$', str(row['first_name'])):
-                return False, f"Invalid first_name: {row['first_name']}"
-            if not re.match(r'^[A-Za-z]+$', str(row['last_name'])):
-                return False, f"Invalid last_name: {row['last_name']}"
+            # Rows are already validated in Python, so the regexes are checked in one
+            # scan per constraint instead of on every inserted row
+            self.cur.execute("""
+                ALTER TABLE employees ADD CONSTRAINT employees_first_name_check
+                    CHECK (first_name ~ '^[A-Za-z]+$') NOT VALID;
+                ALTER TABLE employees ADD CONSTRAINT employees_last_name_check
+                    CHECK (last_name ~ '^[A-Za-z]+$') NOT VALID;
+                ALTER TABLE employees ADD CONSTRAINT employees_quarter_no_check
+                    CHECK (quarter_no ~ '^[0-9]{2}[A-Z]{2}[0-9]{4}$' OR quarter_no = 'NA') NOT VALID;
+                ALTER TABLE employees ADD CONSTRAINT employees_email_id_check
+                    CHECK (email_id ~ '^[a-zA-Z]+[.][a-zA-Z]+@sail[.]bokaro[.]com$') NOT VALID;
+                ALTER TABLE employees ADD CONSTRAINT employees_phone_number_check
+                    CHECK (phone_number ~ '^[0-9]{10}$') NOT VALID;
+                ALTER TABLE employees ADD CONSTRAINT employees_account_number_check
+                    CHECK (account_number ~ '^[0-9]{1,20}$') NOT VALID;
+                ALTER TABLE employees ADD CONSTRAINT employees_ifsc_code_check
+                    CHECK (ifsc_code ~ '^[A-Z]{4}[0-9]{5,}$') NOT VALID;
+            """)
 
-            # Validate date
-            try:
-                datetime.strptime(str(row['date_of_joining']), '%Y-%m-%d')
-            except ValueError:
-                return False, f"Invalid date_of_joining: {row['date_of_joining']}"
+            self.cur.execute("""
+                ALTER TABLE employees VALIDATE CONSTRAINT employees_first_name_check;
+                ALTER TABLE employees VALIDATE CONSTRAINT employees_last_name_check;
+                ALTER TABLE employees VALIDATE CONSTRAINT employees_quarter_no_check;
+                ALTER TABLE employees VALIDATE CONSTRAINT employees_email_id_check;
+                ALTER TABLE employees VALIDATE CONSTRAINT employees_phone_number_check;
+                ALTER TABLE employees VALIDATE CONSTRAINT employees_account_number_check;
+                ALTER TABLE employees VALIDATE CONSTRAINT employees_ifsc_code_check;
+            """)
+            logging.info("Check constraints added successfully")
+        except Error as e:
+            logging.error(f"Error adding check constraints: {e}")
+            raise
 
-            # Validate quarter_no if not 'NA'
-            if str(row['quarter_no']) != 'NA':
-                if not re.match(r'^[0-9]{2}[A-Z]{2}[0-9]{4}$', str(row['quarter_no'])):
-                    return False, f"Invalid quarter_no: {row['quarter_no']}"
+    def create_indexes(self) -> None:
+        """Create secondary indexes and the email uniqueness constraint (run after bulk loading)"""
+        try:
+            # Building these once after the load is cheaper than maintaining them on every insert
+            self.cur.execute("""
+                ALTER TABLE employees ADD CONSTRAINT employees_email_id_key UNIQUE (email_id);
+            """)
 
-            # Validate email
-            if not re.match(r'^[a-zA-Z]+[.][a-zA-Z]+@sail[.]bokaro[.]com$', str(row['email_id'])):
-                return False, f"Invalid email_id: {row['email_id']}"
+            # Create indexes for frequent queries
+            self.cur.execute("""
+                CREATE INDEX IF NOT EXISTS idx_employee_email ON employees(email_id);
+                CREATE INDEX IF NOT EXISTS idx_employee_department ON employees(department);
+                CREATE INDEX IF NOT EXISTS idx_pay_employee_id ON pay_structure(employee_id);
+            """)
+            logging.info("Indexes created successfully")
+        except Error as e:
+            logging.error(f"Error creating indexes: {e}")
+            raise
 
-            # Validate phone number
-            if not re.match(r'^[0-9]{10}$', str(row['phone_number'])):
-                return False, f"Invalid phone_number: {row['phone_number']}"
+    def validate_employee_data(self, df: pd.DataFrame) -> pd.Series:
+        """Validate employee data before insertion, returning the first error for each invalid row"""
+        workers = min(self.validation_workers, len(df) // self.parallel_validation_rows)
+        if workers > 1:
+            # Regex checks are CPU bound and independent per row, so spread large frames across processes
+            chunk_size = -(-len(df) // workers)
+            chunks = [df.iloc[start:start + chunk_size] for start in range(0, len(df), chunk_size)]
+            # Spawn rather than fork: the connection pools already run background threads
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                errors = pd.concat(executor.map(employee_field_errors, chunks))
+        else:
+            errors = employee_field_errors(df)
 
-            # Validate IFSC code
-            if not self.validate_ifsc_code(row['ifsc_code']):
-                return False, f"Invalid ifsc_code: {row['ifsc_code']}"
+        employee_id = pd.to_numeric(df['employee_id'], errors='coerce')
 
-            # Validate account number
-            if not re.match(r'^[0-9]{1,20}$', str(row['account_number'])):
-                return False, f"Invalid account_number: {row['account_number']}"
+        # Catch duplicates up front so they cannot abort a whole bulk load batch
+        for field, values in [('employee_id', employee_id), ('email_id', df['email_id'])]:
+            is_valid = errors.isna()
+            duplicate = values.where(is_valid).duplicated() & is_valid
+            errors[duplicate] = f"Duplicate {field}: " + df.loc[duplicate, field].astype(str)
 
-            return True, None
-        except Exception as e:
-            return False, f"Validation error: {str(e)}"
+        return errors
 
-    def validate_pay_data(self, row: pd.Series) -> Tuple[bool, Optional[str]]:
-        """Validate pay structure data before insertion"""
+    def validate_pay_data(self, row: Tuple) -> Tuple[bool, Optional[str]]:
+        """Validate pay structure data (a tuple in PAY_COLUMNS order) before insertion"""
         try:
             # Validate numeric fields
-            if float(row['base_salary']) <= 20000:
-                return False, f"Invalid base_salary: {row['base_salary']}"
+            base_salary = row[PAY_INDEX['base_salary']]
+            if base_salary <= 20000:
+                return False, f"Invalid base_salary: {base_salary}"
 
             # Validate non-negative values
             for field in ['da', 'hra', 'stocks', 'vacation_tour', 'medical_benefits']:
-                if float(row[field]) < 0:
-                    return False, f"Invalid {field}: {row[field]}"
+                value = row[PAY_INDEX[field]]
+                if value < 0:
+                    return False, f"Invalid {field}: {value}"
 
             # Validate bonus amount
-            if float(row['bonus_amount']) > 25000:
-                return False, f"Invalid bonus_amount: {row['bonus_amount']}"
+            bonus_amount = row[PAY_INDEX['bonus_amount']]
+            if bonus_amount > 25000:
+                return False, f"Invalid bonus_amount: {bonus_amount}"
 
             return True, None
         except Exception as e:
             return False, f"Validation error: {str(e)}"
 
+    def calculate_income_tax(self, annual_income: pd.Series) -> np.ndarray:
+        """Calculate monthly income tax for a column of annual incomes, mirroring the SQL function"""
+        income = annual_income.to_numpy(dtype=float)
+        # New tax regime 2023-24
+        tax = np.select(
+            [
+                income <= 300000,
+                income <= 600000,
+                income <= 900000,
+                income <= 1200000,
+                income <= 1500000
+            ],
+            [
+                0,
+                (income - 300000) * 0.05,
+                15000 + (income - 600000) * 0.10,
+                45000 + (income - 900000) * 0.15,
+                90000 + (income - 1200000) * 0.20
+            ],
+            default=150000 + (income - 1500000) * 0.30
+        )
+
+        # Return monthly tax, rounding half up like ROUND(numeric, 2); the small
+        # offset absorbs float error at exact half-cent boundaries
+        return np.floor(tax / 12 * 100 + 0.5 + 1e-6) / 100
+
+    def copy_batch(self, table: str, columns: List[str], batch: pd.DataFrame) -> None:
+        """Stream a batch of rows into a table with COPY"""
+        types = COPY_TYPES.get(table)
+        # Binary COPY avoids text encoding and server-side parsing when the column types are known
+        copy_format = "BINARY" if types else "TEXT"
+        with self.cur.copy(
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN (FORMAT {copy_format})"
+        ) as copy:
+            if types:
+                copy.set_types(types)
+            for row in batch[columns].itertuples(index=False, name=None):
+                copy.write_row(row)
+
+    def insert_batch(self, table: str, columns: List[str], batch: pd.DataFrame) -> None:
+        """Insert a batch of rows one statement at a time inside a pipeline"""
+        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+        # Statements are sent back to back and synced once, so the batch costs a single round trip
+        error = None
+        with self.conn.pipeline() as pipeline:
+            try:
+                for row in batch[columns].itertuples(index=False, name=None):
+                    self.cur.execute(sql, row)
+                pipeline.sync()
+            except Error as e:
+                # Keep the server error and drain the aborted pipeline here, so leaving the
+                # block neither replaces it with PipelineAborted nor logs a second warning
+                error = e
+                try:
+                    pipeline.sync()
+                except psycopg.errors.PipelineAborted:
+                    pass
+        if error is not None:
+            raise error
+
+    def record_rejections(self, table: str, errors: pd.Series) -> None:
+        """Keep rejected rows, keyed by CSV line number, for the rejects file"""
+        # DataFrame index 0 is the first data line, which follows the header on line 2
+        self.rejected_rows.extend((table, index + 2, error) for index, error in errors.items())
+
+    def log_rejections(self, table: str, errors: pd.Series) -> None:
+        """Record rejected rows and log one summary instead of a warning per row"""
+        if errors.empty:
+            return
+        self.record_rejections(table, errors)
+        sample = errors.head(self.rejects_log_sample)
+        details = '; '.join(f"line {index + 2}: {error}" for index, error in sample.items())
+        logging.warning(f"Skipping {len(errors)} invalid {table} records, first {len(sample)}: {details}")
+
+    def bulk_load(self, table: str, columns: List[str], df: pd.DataFrame) -> pd.Series:
+        """Bulk load a DataFrame in batches, returning a mask of the loaded rows"""
+        loaded = pd.Series(False, index=df.index)
+        # COPY is preferred; batched INSERTs are kept for servers or proxies without COPY support
+        batch_size = self.copy_batch_size if self.use_copy else self.insert_batch_size
+        load_batch = self.copy_batch if self.use_copy else self.insert_batch
+
+        for start in range(0, len(df), batch_size):
+            batch = df.iloc[start:start + batch_size]
+            # A savepoint per batch means a bad row only aborts its own batch
+            self.cur.execute("SAVEPOINT bulk_load_batch")
+            try:
+                load_batch(table, columns, batch)
+                self.cur.execute("RELEASE SAVEPOINT bulk_load_batch")
+                loaded.iloc[start:start + len(batch)] = True
+            except Error as e:
+                self.cur.execute("ROLLBACK TO SAVEPOINT bulk_load_batch")
+                logging.warning(f"Error loading batch of {len(batch)} {table} records: {e}")
+                self.record_rejections(table, pd.Series(f"Batch rejected by server: {e}", index=batch.index))
+
+        return loaded
+
     def import_data(self, employee_file: str, pay_file: str) -> None:
         """Import data from CSV files with improved error handling"""
+        # Load everything in a single transaction instead of committing every statement
+        autocommit = self.conn.autocommit
+        self.conn.autocommit = False
         try:
             # Import employee data first
-            employees_df = pd.read_csv(employee_file)
-            # Replace NaN with 'NA' for employee table
-            employees_df = employees_df.fillna('NA')
+            # Read every column as text; empty fields stay empty strings instead of NaN
+            employees_df = pd.read_csv(
+                employee_file, usecols=EMPLOYEE_COLUMNS, dtype=str, na_filter=False
+            )
+            # Fill only the columns whose schema default is 'NA' instead of rewriting the whole frame
+            for column in ['grade', 'quarter_no']:
+                employees_df[column] = employees_df[column].replace('', 'NA')
             
-            successful_inserts = 0
-            failed_inserts = 0
-
-            for _, row in employees_df.iterrows():
-                if 'ifsc_code' in row:
-                    row['ifsc_code'] = str(row['ifsc_code']).strip()
-                
-                is_valid, error_msg = self.validate_employee_data(row)
-                if is_valid:
-                    try:
-                        values = [
-                            int(row['employee_id']), str(row['first_name']), str(row['last_name']),
-                            str(row['designation']), str(row['department']), str(row['grade']),
-                            str(row['date_of_joining']), str(row['quarter_no']), str(row['email_id']),
-                            str(row['phone_number']), str(row['account_number']), str(row['ifsc_code']),
-                            str(row['branch_name']), str(row['bank_name']), str(row['shop'])
-                        ]
-                        
-                        self.cur.execute("""
-                            INSERT INTO employees (
-                                employee_id, first_name, last_name, designation,
-                                department, grade, date_of_joining, quarter_no,
-                                email_id, phone_number, account_number, ifsc_code,
-                                branch_name, bank_name, shop
-                            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        """, values)
-                        
-                        self.successful_employee_ids.add(int(row['employee_id']))
-                        successful_inserts += 1
-                    except Error as e:
-                        logging.warning(f"Error inserting employee record: {e}")
-                        failed_inserts += 1
-                else:
-                    logging.warning(f"Skipping invalid employee record: {error_msg}")
-                    failed_inserts += 1
+            employees_df['ifsc_code'] = employees_df['ifsc_code'].str.strip()
+
+            errors = self.validate_employee_data(employees_df)
+            self.log_rejections('employees', errors.dropna())
+            failed_inserts = int(errors.notna().sum())
+
+            valid_employees_df = employees_df[errors.isna()].copy()
+            valid_employees_df['employee_id'] = pd.to_numeric(valid_employees_df['employee_id']).astype(int)
+            valid_employees_df['date_of_joining'] = pd.to_datetime(
+                valid_employees_df['date_of_joining'], format='%Y-%m-%d'
+            ).dt.date
+            loaded = self.bulk_load('employees', EMPLOYEE_COLUMNS, valid_employees_df)
+            self.successful_employee_ids.update(valid_employees_df.loc[loaded, 'employee_id'])
+            successful_inserts = int(loaded.sum())
+            failed_inserts += len(valid_employees_df) - successful_inserts
 
             logging.info(f"Employees import completed - Successful: {successful_inserts}, Failed: {failed_inserts}")
 
             # Import pay structure data
-            pay_df = pd.read_csv(pay_file)
+            pay_df = pd.read_csv(pay_file, usecols=list(PAY_CSV_DTYPES), dtype=PAY_CSV_DTYPES)
+
+            # Drop pay records whose employee was not imported
+            has_employee = pay_df['employee_id'].isin(self.successful_employee_ids)
+            self.log_rejections(
+                'pay_structure',
+                "Non-existent employee_id: " + pay_df.loc[~has_employee, 'employee_id'].astype(str)
+            )
+            pay_failed = int((~has_employee).sum())
+            pay_df = pay_df[has_employee]
             
             # Replace NaN with 0 for nullable columns
             nullable_columns = ['ta', 'stocks', 'vacation_tour', 'uniform_allowance', 'other_allowances']
@@ -365,63 +551,50 @@ class DatabaseManager:
                 pay_df['medical_benefits'] +  # 
                 pay_df['bonus_amount']  # 
             )
+
+            # Calculate monthly income tax for all rows at once
+            pay_df['income_tax'] = self.calculate_income_tax(pay_df['annual_income'])
             
-            pay_successful = 0
-            pay_failed = 0
-
-            for _, row in pay_df.iterrows():
-                if int(row['employee_id']) in self.successful_employee_ids:
-                    is_valid, error_msg = self.validate_pay_data(row)
-                    if is_valid:
-                        try:
-                            # Calculate monthly income tax
-                            self.cur.execute(
-                                "SELECT calculate_income_tax(%s)",
-                                (float(row['annual_income']),)
-                            )
-                            monthly_tax = self.cur.fetchone()[0]
-                            
-                            values = (
-                                int(row['pay_id']), 
-                                int(row['employee_id']), 
-                                float(row['base_salary']),
-                                float(row['ta']), 
-                                float(row['da']), 
-                                float(row['hra']), 
-                                float(row['stocks']),
-                                float(row['vacation_tour']), 
-                                float(row['uniform_allowance']),
-                                float(row['medical_benefits']), 
-                                float(row['bonus_amount']),
-                                float(row['other_allowances']), 
-                                float(monthly_tax)
-                            )
-                            
-                            self.cur.execute("""
-                                INSERT INTO pay_structure (
-                                    pay_id, employee_id, base_salary, ta, da, hra,
-                                    stocks, vacation_tour, uniform_allowance,
-                                    medical_benefits, bonus_amount, other_allowances,
-                                    income_tax
-                                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                            """, values)
-                            
-                            pay_successful += 1
-                        except Error as e:
-                            logging.warning(f"Error inserting pay record: {e}")
-                            pay_failed += 1
-                    else:
-                        logging.warning(f"Skipping invalid pay record: {error_msg}")
-                        pay_failed += 1
+            pay_errors = {}
+            seen_pay_ids = set()
+
+            # Columns already carry their final dtypes, so itertuples yields native ints and floats
+            rows = pay_df[PAY_COLUMNS].itertuples(index=False, name=None)
+            for index, row in zip(pay_df.index, rows):
+                pay_id = row[PAY_INDEX['pay_id']]
+                is_valid, error_msg = self.validate_pay_data(row)
+                if is_valid and pay_id in seen_pay_ids:
+                    is_valid, error_msg = False, f"Duplicate pay_id: {pay_id}"
+
+                if is_valid:
+                    seen_pay_ids.add(pay_id)
                 else:
-                    logging.warning(f"Skipping pay record for non-existent employee_id: {row['employee_id']}")
-                    pay_failed += 1
+                    pay_errors[index] = error_msg
+
+            pay_errors = pd.Series(pay_errors, dtype=object)
+            self.log_rejections('pay_structure', pay_errors)
+            pay_failed += len(pay_errors)
+
+            valid_pay_df = pay_df.drop(index=pay_errors.index)
+            loaded = self.bulk_load('pay_structure', PAY_COLUMNS, valid_pay_df)
+            pay_successful = int(loaded.sum())
+            pay_failed += len(valid_pay_df) - pay_successful
 
             logging.info(f"Pay structure import completed - Successful: {pay_successful}, Failed: {pay_failed}")
 
+            if self.rejected_rows:
+                pd.DataFrame(self.rejected_rows, columns=['table', 'line', 'error']).to_csv(
+                    self.rejects_file, index=False
+                )
+                logging.info(f"Wrote {len(self.rejected_rows)} rejected records to {self.rejects_file}")
+
+            self.conn.commit()
         except Exception as e:
+            self.conn.rollback()
             logging.error(f"Error importing data: {e}")
             raise
+        finally:
+            self.conn.autocommit = autocommit
 
     def create_total_compensation_function(self) -> None:
         """Create a function to calculate total compensation (including annual benefits)"""
@@ -439,7 +612,15 @@ class DatabaseManager:
                     annual_benefits NUMERIC;
                 BEGIN
                     -- Calculate monthly compensation
-                    SELECT monthly_salary INTO monthly_comp
+                    SELECT (
+                        base_salary + 
+                        COALESCE(ta, 0) + 
+                        COALESCE(da, 0) + 
+                        COALESCE(hra, 0) + 
+                        COALESCE(uniform_allowance, 0) - 
+                        (base_salary * 0.125) -  -- Subtract employee PF
+                        COALESCE(income_tax, 0)  -- Subtract income tax
+                    )::NUMERIC(10,2) INTO monthly_comp
                     FROM pay_structure
                     WHERE employee_id = p_employee_id;
                     
@@ -483,28 +664,61 @@ class DatabaseManager:
                     p.employee_pf as monthly_pf_deduction,
                     p.employer_pf as monthly_company_pf,
                     p.income_tax as monthly_tax,
-                    comp.monthly_compensation,
-                    comp.annual_compensation,
-                    comp.total_benefits as annual_benefits,
+                    -- Same figures as calculate_total_compensation, computed inline
+                    -- from the join instead of calling the function per employee
+                    COALESCE(p.monthly_salary, 0) as monthly_compensation,
+                    COALESCE(p.monthly_salary, 0) * 12 + COALESCE(
+                        COALESCE(p.stocks, 0) +
+                        COALESCE(p.vacation_tour, 0) +
+                        p.medical_benefits +
+                        p.bonus_amount, 0
+                    ) as annual_compensation,
+                    COALESCE(
+                        COALESCE(p.stocks, 0) +
+                        COALESCE(p.vacation_tour, 0) +
+                        p.medical_benefits +
+                        p.bonus_amount, 0
+                    ) as annual_benefits,
                     e.date_of_joining,
                     e.email_id,
                     e.phone_number
                 FROM employees e
-                LEFT JOIN pay_structure p ON e.employee_id = p.employee_id
-                CROSS JOIN LATERAL calculate_total_compensation(e.employee_id) comp;
+                LEFT JOIN (
+                    SELECT
+                        *,
+                        (
+                            base_salary + 
+                            COALESCE(ta, 0) + 
+                            COALESCE(da, 0) + 
+                            COALESCE(hra, 0) + 
+                            COALESCE(uniform_allowance, 0) - 
+                            (base_salary * 0.125) -  -- Subtract employee PF
+                            COALESCE(income_tax, 0)  -- Subtract income tax
+                        )::NUMERIC(10,2) as monthly_salary
+                    FROM pay_structure
+                ) p ON e.employee_id = p.employee_id;
             """)
             logging.info("Employee summary view created successfully")
         except Error as e:
             logging.error(f"Error creating employee summary view: {e}")
             raise
 
+    def release_connection(self) -> None:
+        """Close the cursor and return the current connection to its pool"""
+        if self.cur:
+            self.cur.close()
+            self.cur = None
+        if self.conn:
+            self.conn_pool.putconn(self.conn)
+            self.conn = None
+            self.conn_pool = None
+
     def cleanup(self) -> None:
         """Clean up database connections"""
         try:
-            if self.cur:
-                self.cur.close()
-            if self.conn:
-                self.conn.close()
+            self.release_connection()
+            self.pool.close()
+            self.admin_pool.close()
             logging.info("Database connections cleaned up")
         except Error as e:
             logging.error(f"Error during cleanup: {e}")
@@ -527,11 +741,9 @@ def main():
         db_manager.connect_to_default_db()
         db_manager.create_database()
         
-        # Additional delay after database creation
-        time.sleep(3)
-        
+        # The new database is connectable as soon as CREATE DATABASE returns
         db_manager.connect_to_psu_db()
-        db_manager.create_tables()
+        db_manager.create_base_tables()
 
         # Import data if CSV files exist
         if os.path.exists('psu_employees.csv') and os.path.exists('pay_structure.csv'):
@@ -542,6 +754,10 @@ def main():
         else:
             logging.warning("CSV files not found, skipping data import")
 
+        # Add format checks and build secondary indexes once the data is in place
+        db_manager.add_check_constraints()
+        db_manager.create_indexes()
+
         logging.info("Database setup completed successfully")
 
     except Exception as e:
@@ -1,7 +1,22 @@
-from typing import Tuple, List, Dict, Any, Set
-import random
+from typing import Tuple, List, Dict, Any
+from itertools import chain
+from multiprocessing import Pool
+import os
+import sys
 from datetime import datetime, timedelta
-import csv
+import numpy as np
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    # Without pyarrow, CSV files are written with pandas
+    pa = None
+    import pandas as pd
+
+
+# Shared string objects for the has_quarter column
+YES, NO = sys.intern('Yes'), sys.intern('No')
 
 
 class DataConstants:
@@ -49,6 +64,10 @@ class DataConstants:
         'Machine Shop', 'Structural Shop', 'Coke Oven'
     ]
 
+    WORKER_GRADES = [f"S{i}" for i in range(1, 6)]
+
+    SUPERVISOR_GRADES = [f"S{i}" for i in range(6, 12)]
+
     MANAGER_DESIGNATIONS = [
         'Junior Manager', 'Assistant Manager', 'Deputy Manager', 'Manager', 'Senior Manager'
     ]
@@ -66,6 +85,10 @@ class DataConstants:
         ('Union Bank of India', 'UBIN')
     ]
 
+    BANK_NAMES = tuple(bank_name for bank_name, _ in BANKS)
+
+    BANK_CODES = tuple(bank_code for _, bank_code in BANKS)
+
     BRANCHES = [
         'Main Branch', 'Civil Lines', 'Sector 4', 'Industrial Area', 'City Center',
         'Station Road', 'Steel Plant Branch', 'Township Branch'
@@ -75,116 +98,203 @@ class DataConstants:
 class EmployeeGenerator:
     def __init__(self):
         self.constants = DataConstants()
-        self.name_mapping = self.create_name_mapping()
-
-    def create_name_mapping(self) -> Dict[str, List[str]]:
-        """Create a mapping of each first name to a unique set of last names."""
-        first_names = self.constants.FIRST_NAMES
+        # PCG64 generator, faster than the legacy global MT19937 state for bulk draws
+        self.rng = np.random.default_rng()
+        self.first_names = np.array(self.constants.FIRST_NAMES, dtype=object)
+        self.last_name_table = self.create_last_name_table()
+        self.joining_dates = self.create_joining_dates()
+
+    def create_last_name_table(self) -> np.ndarray:
+        """Create a table whose row i holds the unique set of last names for first name i."""
         last_names = self.constants.LAST_NAMES
-        mapping = {}
-        for i, first_name in enumerate(first_names):
-            mapping[first_name] = [
-                last_names[(i * 100 + j) % len(last_names)] for j in range(100)
-            ]
-        return mapping
+        return np.array(
+            [
+                [last_names[(i * 100 + j) % len(last_names)] for j in range(100)]
+                for i in range(len(self.first_names))
+            ],
+            dtype=object
+        )
+
+    def create_joining_dates(self) -> np.ndarray:
+        """Precompute every possible date of joining as a formatted string."""
+        start_date = datetime(2000, 1, 1)
+        days_between = (datetime(2023, 12, 31) - start_date).days
+        return np.array(
+            [(start_date + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(days_between)],
+            dtype=object
+        )
 
     def generate_employee_ids(self, count: int) -> List[int]:
         """Generate a set of unique 7-digit employee IDs."""
-        employee_ids: Set[int] = set()
+        # Oversample in one draw so collisions rarely need a second pass
+        employee_ids = np.unique(self.rng.integers(1000000, 10000000, size=int(count * 1.15) + 1))
         while len(employee_ids) < count:
-            emp_id = random.randint(1000000, 9999999)
-            employee_ids.add(emp_id)
-        return sorted(list(employee_ids))
-
-    def generate_unique_full_name(self, existing_names: Set[str]) -> Tuple[str, str]:
-        """Generate a unique full name that doesn't already exist."""
-        while True:
-            first_name = random.choice(list(self.name_mapping.keys()))
-            last_name = random.choice(self.name_mapping[first_name])
-            full_name = f"{first_name} {last_name}"
-            if full_name not in existing_names:
-                existing_names.add(full_name)
-                return first_name, last_name
-
-    def generate_phone_number(self) -> str:
-        return f"9{random.randint(100000000, 999999999)}"
-
-    def generate_account_number(self) -> str:
-        return str(random.randint(10000000000, 99999999999999999))
-
-    def generate_ifsc_code(self, bank_code: str) -> str:
-        return f"{bank_code}{random.randint(10000, 99999)}"
-
-    def generate_date_of_joining(self) -> str:
-        start_date = datetime(2000, 1, 1)
-        end_date = datetime(2023, 12, 31)
-        days_between = (end_date - start_date).days
-        random_days = random.randrange(days_between)
-        return (start_date + timedelta(days=random_days)).strftime('%Y-%m-%d')
-
-    def generate_quarter_no(self) -> str:
-        if random.random() < 0.6:  # 60% chance of having a quarter
-            second_digit = random.randint(1, 9)
-            third_digit = random.choice(['A', 'B', 'C', 'D', 'E', 'F'])
-            quarter_type = random.choice(['A', 'B', 'C', 'D'])
-            quarter_no = random.randint(1799, 2099)
-            return f"0{second_digit}{third_digit}{quarter_type}{quarter_no}"
-        return ""
-
-    def generate_employee_data(self, emp_id: int, existing_names: Set[str]) -> Dict[str, Any]:
-        first_name, last_name = self.generate_unique_full_name(existing_names)
-
-        role_type = random.choices(
-            ['Worker', 'Officer', 'Manager', 'Executive'],
-            weights=[40, 30, 20, 10]
-        )[0]
-
-        if role_type == 'Worker':
-            grade = f"S{random.randint(1, 5)}"
-            designation = f"Worker "
-        elif role_type == 'Officer':
-            grade = f"S{random.randint(6, 11)}"
-            designation = f"Supervisor "
-        elif role_type == 'Manager':
-            grade = ''
-            designation = random.choice(self.constants.MANAGER_DESIGNATIONS)
-        else:
-            grade = ''
-            designation = random.choice(self.constants.EXECUTIVE_DESIGNATIONS)
+            extra = self.rng.integers(1000000, 10000000, size=count - len(employee_ids))
+            employee_ids = np.unique(np.concatenate([employee_ids, extra]))
+        # np.unique sorts, so drop the surplus at random rather than trimming the largest IDs
+        employee_ids = np.sort(self.rng.choice(employee_ids, count, replace=False))
+        # IDs are unique by construction; strictly increasing after sorting confirms it
+        assert np.all(np.diff(employee_ids) > 0), "Duplicate employee IDs generated"
+        return employee_ids.tolist()
+
+    def generate_unique_full_names(self, count: int) -> Tuple[List[str], List[str]]:
+        """Generate unique (first name, last name) pairs for count employees."""
+        names_per_first = self.last_name_table.shape[1]
+        total_names = self.last_name_table.size
+        if count > total_names:
+            raise ValueError(f"Cannot generate {count} unique names, only {total_names} exist")
+
+        # Sample distinct name combinations directly instead of retrying on collisions
+        combinations = self.rng.choice(total_names, size=count, replace=False)
+        first_indices, last_indices = np.divmod(combinations, names_per_first)
+        return (
+            self.first_names[first_indices].tolist(),
+            self.last_name_table[first_indices, last_indices].tolist()
+        )
+
+    def generate_quarter_nos(self, count: int) -> List[str]:
+        """Generate quarter numbers, leaving them empty for employees without a quarter."""
+        has_quarter = self.rng.random(count) < 0.6  # 60% chance of having a quarter
+        allotted = int(has_quarter.sum())
+
+        # Draw the quarter number parts only for employees who have one
+        second_digits = self.rng.integers(1, 10, size=allotted).tolist()
+        third_digits = self.choose(['A', 'B', 'C', 'D', 'E', 'F'], allotted)
+        quarter_types = self.choose(['A', 'B', 'C', 'D'], allotted)
+        numbers = self.rng.integers(1799, 2100, size=allotted).tolist()
+
+        quarter_nos = np.full(count, '', dtype=object)
+        quarter_nos[has_quarter] = [
+            f"0{second_digit}{third_digit}{quarter_type}{number}"
+            for second_digit, third_digit, quarter_type, number
+            in zip(second_digits, third_digits, quarter_types, numbers)
+        ]
+        return quarter_nos.tolist()
+
+    def choose(self, values: List[str], count: int) -> List[str]:
+        """Pick count random items, reusing the constant string objects instead of copying them."""
+        return np.array(values, dtype=object)[self.rng.integers(0, len(values), size=count)].tolist()
 
-        bank_name, bank_code = random.choice(self.constants.BANKS)
-        branch_name = random.choice(self.constants.BRANCHES)
-        quarter_no = self.generate_quarter_no()
+    def generate_grades_and_designations(self, role_types: np.ndarray) -> Tuple[List[str], List[str]]:
+        """Assign grades and designations with one draw per role instead of one per employee."""
+        grades = np.full(len(role_types), '', dtype=object)
+        designations = np.empty(len(role_types), dtype=object)
+
+        workers = role_types == 'Worker'
+        grades[workers] = self.choose(self.constants.WORKER_GRADES, workers.sum())
+        designations[workers] = "Worker "
+
+        supervisors = role_types == 'Supervisor'
+        grades[supervisors] = self.choose(self.constants.SUPERVISOR_GRADES, supervisors.sum())
+        designations[supervisors] = "Supervisor "
+
+        managers = role_types == 'Manager'
+        designations[managers] = self.choose(self.constants.MANAGER_DESIGNATIONS, managers.sum())
+
+        executives = role_types == 'Executive'
+        designations[executives] = self.choose(self.constants.EXECUTIVE_DESIGNATIONS, executives.sum())
+
+        return grades.tolist(), designations.tolist()
+
+    def generate_employees(self, num_employees: int) -> Dict[str, List[Any]]:
+        """Generate employees as columns (one list per field) rather than one dict per row."""
+        employee_ids = self.generate_employee_ids(num_employees)
+
+        first_names, last_names = self.generate_unique_full_names(num_employees)
+
+        role_types = self.rng.choice(
+            np.array(['Worker', 'Supervisor', 'Manager', 'Executive'], dtype=object),
+            size=num_employees,
+            p=[0.4, 0.3, 0.2, 0.1]
+        )
+        grades, designations = self.generate_grades_and_designations(role_types)
+
+        dates_of_joining = self.joining_dates[
+            self.rng.integers(0, len(self.joining_dates), size=num_employees)
+        ].tolist()
+
+        quarter_nos = self.generate_quarter_nos(num_employees)
+
+        # One index per employee gathers both the bank name and its code
+        bank_indices = self.rng.integers(0, len(self.constants.BANK_CODES), size=num_employees)
+        bank_codes = np.array(self.constants.BANK_CODES, dtype=object)[bank_indices].tolist()
+        ifsc_suffixes = self.rng.integers(10000, 100000, size=num_employees).astype(str).tolist()
 
         return {
-            'employee_id': str(emp_id),
-            'first_name': first_name,
-            'last_name': last_name,
-            'designation': designation,
-            'department': random.choice(self.constants.DEPARTMENTS),
-            'grade': grade,
-            'date_of_joining': self.generate_date_of_joining(),
-            'quarter_no': quarter_no,
-            'has_quarter': 'Yes' if quarter_no else 'No',
-            'email_id': f"{first_name.lower()}.{last_name.lower()}@sail.bokaro.com",
-            'phone_number': self.generate_phone_number(),
-            'account_number': self.generate_account_number(),
-            'ifsc_code': self.generate_ifsc_code(bank_code),
-            'branch_name': branch_name,
-            'bank_name': bank_name,
-            'shop': random.choice(self.constants.SHOPS)
+            'employee_id': employee_ids,
+            'first_name': first_names,
+            'last_name': last_names,
+            'designation': designations,
+            # Not written to the CSV; lets the pay generator skip decoding roles from designations
+            'role': role_types.tolist(),
+            'department': self.choose(self.constants.DEPARTMENTS, num_employees),
+            'grade': grades,
+            'date_of_joining': dates_of_joining,
+            'quarter_no': quarter_nos,
+            'has_quarter': [YES if quarter_no else NO for quarter_no in quarter_nos],
+            'email_id': [
+                f"{first_name}.{last_name}@sail.bokaro.com".lower()
+                for first_name, last_name in zip(first_names, last_names)
+            ],
+            'phone_number': (
+                9000000000 + self.rng.integers(100000000, 1000000000, size=num_employees, dtype=np.int64)
+            ).tolist(),
+            'account_number': self.rng.integers(
+                10000000000, 100000000000000000, size=num_employees, dtype=np.int64
+            ).astype(str).tolist(),
+            'ifsc_code': [bank_code + suffix for bank_code, suffix in zip(bank_codes, ifsc_suffixes)],
+            'branch_name': self.choose(self.constants.BRANCHES, num_employees),
+            'bank_name': np.array(self.constants.BANK_NAMES, dtype=object)[bank_indices].tolist(),
+            'shop': self.choose(self.constants.SHOPS, num_employees)
         }
 
-    def generate_employees(self, num_employees: int) -> List[Dict[str, Any]]:
-        employee_ids = self.generate_employee_ids(num_employees)
-        existing_names = set()
-        return [self.generate_employee_data(emp_id, existing_names) for emp_id in employee_ids]
+
+# Role batch size from which allowances are computed by the parallel numba kernel; smaller
+# batches stay on NumPy, which beats paying for the numba import and kernel load
+NUMBA_ALLOWANCE_ROWS = 1000000
+
+allowance_kernel = None
+
+
+def load_allowance_kernel():
+    """Import numba and compile the allowance kernel on first use; returns None when numba is not installed."""
+    global allowance_kernel
+    if allowance_kernel is None:
+        try:
+            from numba import njit, prange
+        except ImportError:
+            return None
+
+        @njit(parallel=True, cache=True)
+        def calculate_allowance_arrays(base_salary, has_quarter, da_percent, hra_percent, bonus_min, bonus_max,
+                                       share_ranges):
+            """Compute da, hra and bonus, plus one row of salary-share allowances per (low, high) row of share_ranges."""
+            count = len(base_salary)
+            da = np.empty(count, dtype=np.int64)
+            hra = np.empty(count, dtype=np.int64)
+            bonus = np.empty(count, dtype=np.int64)
+            shares = np.empty((len(share_ranges), count), dtype=np.int64)
+            for i in prange(count):
+                base = base_salary[i]
+                da[i] = round(base * da_percent)
+                hra[i] = 0 if has_quarter[i] else round(base * hra_percent)
+                bonus[i] = np.random.randint(bonus_min, bonus_max + 1)
+                for j in range(len(share_ranges)):
+                    shares[j, i] = round(base * np.random.uniform(share_ranges[j, 0], share_ranges[j, 1]))
+            return da, hra, bonus, shares
+
+        allowance_kernel = calculate_allowance_arrays
+    return allowance_kernel
 
 
 class PayStructureGenerator:
     def __init__(self):
+        self.rng = np.random.default_rng()
+
+        # Salaries are drawn on a 1000 grid; the schema requires base_salary > 20000,
+        # so the Worker grid starts at 21000
         self.salary_ranges = {
-            'Worker': (20000, 28000),
+            'Worker': (21000, 28000),
             'Supervisor': (44000, 57000),
             'Manager': (73000, 92000),
             'Executive': (145000, 205000)
@@ -207,78 +317,148 @@ class PayStructureGenerator:
             'Executive': (25000, 25000)
         }
 
-    def generate_base_salary(self, role: str) -> float:
+        # Allowances drawn as a (low, high) share of base salary
+        self.salary_shares = {
+            'Worker': {'other_allowances': (0.05, 0.08)},
+            'Supervisor': {'other_allowances': (0.05, 0.08), 'ta': (0.08, 0.12)},
+            'Manager': {'other_allowances': (0.05, 0.08), 'ta': (0.08, 0.12), 'vacation_tour': (0.15, 0.20)},
+            'Executive': {
+                'other_allowances': (0.05, 0.08), 'ta': (0.08, 0.12), 'vacation_tour': (0.15, 0.20),
+                'stocks': (0.3, 0.35)
+            }
+        }
+
+        # Each role gets a calculator that adds its fixed-value allowances to the salary-based
+        # ones; columns it leaves out stay empty
+        self.allowance_calculators = {
+            'Worker': self.calculate_worker_allowances,
+            'Supervisor': self.calculate_supervisor_allowances,
+            'Manager': self.calculate_manager_allowances,
+            'Executive': self.calculate_executive_allowances
+        }
+
+    def generate_base_salary(self, role: str, count: int) -> np.ndarray:
         min_salary, max_salary = self.salary_ranges[role]
-        return round(random.uniform(min_salary, max_salary), -3)
-
-    def calculate_allowances(self, base_salary: float, role: str, has_quarter: bool) -> Dict[str, Any]:
-        allowances = {
-            'da': round(base_salary * self.da_percent),
-            'hra': 0 if has_quarter else round(base_salary * self.hra_percent),
-            'medical_benefits': (
-                random.randint(*self.medical_benefits[role]) 
-                if isinstance(self.medical_benefits[role], tuple) 
-                else self.medical_benefits[role]
-            ),
-            'bonus_amount': random.randint(*self.bonus_ranges[role]),
-            'other_allowances': round(base_salary * random.uniform(0.05, 0.08))
+        # Draw whole thousands directly rather than rounding a uniform float
+        return self.rng.integers(min_salary // 1000, max_salary // 1000 + 1, size=count) * 1000
+
+    def calculate_salary_allowances(self, role: str, base_salary: np.ndarray, has_quarter: np.ndarray) -> Dict[str, Any]:
+        """Compute the allowances derived from base salary: da, hra, bonus and the role's salary shares."""
+        shares = self.salary_shares[role]
+        bonus_min, bonus_max = self.bonus_ranges[role]
+        count = len(base_salary)
+        kernel = load_allowance_kernel() if count >= NUMBA_ALLOWANCE_ROWS else None
+        if kernel is not None:
+            da, hra, bonus, share_values = kernel(
+                base_salary, has_quarter, self.da_percent, self.hra_percent, bonus_min, bonus_max,
+                np.array(list(shares.values()), dtype=np.float64)
+            )
+        else:
+            da = np.rint(base_salary * self.da_percent).astype(np.int64)
+            hra = np.where(has_quarter, 0, np.rint(base_salary * self.hra_percent)).astype(np.int64)
+            bonus = self.rng.integers(bonus_min, bonus_max + 1, size=count)
+            share_values = [
+                np.rint(base_salary * self.rng.uniform(low, high, count)).astype(np.int64)
+                for low, high in shares.values()
+            ]
+        return {'da': da, 'hra': hra, 'bonus_amount': bonus, **dict(zip(shares, share_values))}
+
+    def calculate_worker_allowances(self, base_salary: np.ndarray, has_quarter: np.ndarray) -> Dict[str, Any]:
+        return {
+            **self.calculate_salary_allowances('Worker', base_salary, has_quarter),
+            'medical_benefits': np.full(len(base_salary), self.medical_benefits['Worker']),
+            'uniform_allowance': np.full(len(base_salary), 2000)
         }
 
-        allowances['ta'] = (
-            None if role == 'Worker'
-            else round(base_salary * random.uniform(0.08, 0.12))
-        )
-        
-        allowances['stocks'] = (
-            round(base_salary * random.uniform(0.3, 0.35))
-            if role == 'Executive'
-            else None
-        )
-        
-        allowances['vacation_tour'] = (
-            round(base_salary * random.uniform(0.15, 0.20))
-            if role in ['Manager', 'Executive']
-            else None
-        )
-        
-        allowances['uniform_allowance'] = (
-            2000 if role in ['Worker', 'Supervisor']
-            else None
-        )
+    def calculate_supervisor_allowances(self, base_salary: np.ndarray, has_quarter: np.ndarray) -> Dict[str, Any]:
+        return {
+            **self.calculate_salary_allowances('Supervisor', base_salary, has_quarter),
+            'medical_benefits': np.full(len(base_salary), self.medical_benefits['Supervisor']),
+            'uniform_allowance': np.full(len(base_salary), 2000)
+        }
 
-        return allowances
+    def calculate_manager_allowances(self, base_salary: np.ndarray, has_quarter: np.ndarray) -> Dict[str, Any]:
+        return {
+            **self.calculate_salary_allowances('Manager', base_salary, has_quarter),
+            'medical_benefits': np.full(len(base_salary), self.medical_benefits['Manager'])
+        }
 
-    def get_role_from_designation(self, designation: str) -> str:
-        if 'Worker' in designation:
-            return 'Worker'
-        elif 'Supervisor' in designation:
-            return 'Supervisor'
-        elif 'Manager' in designation:
-            return 'Manager'
-        else:
-            return 'Executive'
+    def calculate_executive_allowances(self, base_salary: np.ndarray, has_quarter: np.ndarray) -> Dict[str, Any]:
+        medical_min, medical_max = self.medical_benefits['Executive']
+        return {
+            **self.calculate_salary_allowances('Executive', base_salary, has_quarter),
+            'medical_benefits': self.rng.integers(medical_min, medical_max + 1, size=len(base_salary))
+        }
+
+    def generate_pay_structures(self, employees: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
+        """Generate pay structure columns for employee columns, one batch per role."""
+        roles = np.array(employees['role'], dtype=object)
+        has_quarter = np.array(employees['has_quarter']) == 'Yes'
+
+        columns = {
+            field: np.full(len(roles), None, dtype=object)
+            for field in [
+                'base_salary', 'ta', 'da', 'hra', 'stocks', 'vacation_tour',
+                'uniform_allowance', 'medical_benefits', 'bonus_amount', 'other_allowances'
+            ]
+        }
+        for role in self.salary_ranges:
+            indices = np.flatnonzero(roles == role)
+            base_salary = self.generate_base_salary(role, len(indices))
+            columns['base_salary'][indices] = base_salary
+            for field, values in self.allowance_calculators[role](base_salary, has_quarter[indices]).items():
+                columns[field][indices] = values
 
-    def generate_pay_structure(self, employee: Dict[str, Any]) -> Dict[str, Any]:
-        role = self.get_role_from_designation(employee['designation'])
-        has_quarter = employee['has_quarter'] == 'Yes'
-        
-        base_salary = self.generate_base_salary(role)
-        allowances = self.calculate_allowances(base_salary, role, has_quarter)
-        
         return {
-            'pay_id': int(employee['employee_id']),
-            'employee_id': employee['employee_id'],
-            'base_salary': base_salary,
-            **allowances
+            'pay_id': list(employees['employee_id']),
+            'employee_id': list(employees['employee_id']),
+            **{field: values.tolist() for field, values in columns.items()}
         }
 
-def save_to_csv(data: List[Dict[str, Any]], filename: str, fieldnames: List[str]):
+# Employee count per worker process below which pay structures are generated in-process
+PARALLEL_PAY_ROWS = 100000
+
+
+def init_pay_worker():
+    """Keep each worker's numba kernel to one thread so the processes do not oversubscribe the CPUs."""
+    # numba reads this when it is first imported by load_allowance_kernel
+    os.environ['NUMBA_NUM_THREADS'] = '1'
+
+
+def generate_pay_chunk(employees: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
+    """Generate pay structures for one chunk of employees in a worker process."""
+    # A fresh generator per chunk draws its own OS entropy, so workers never share a random stream
+    return PayStructureGenerator().generate_pay_structures(employees)
+
+
+def generate_pay_structures_parallel(employees: Dict[str, List[Any]], processes: int) -> Dict[str, List[Any]]:
+    """Generate pay structures, splitting large employee sets across worker processes."""
+    count = len(employees['employee_id'])
+    processes = min(processes, count // PARALLEL_PAY_ROWS)
+    if processes <= 1:
+        return PayStructureGenerator().generate_pay_structures(employees)
+
+    bounds = np.linspace(0, count, processes + 1, dtype=int)
+    chunks = [
+        {field: employees[field][start:end] for field in ['employee_id', 'role', 'has_quarter']}
+        for start, end in zip(bounds[:-1], bounds[1:])
+    ]
+    with Pool(processes, initializer=init_pay_worker) as pool:
+        results = pool.map(generate_pay_chunk, chunks)
+
+    return {field: list(chain.from_iterable(result[field] for result in results)) for field in results[0]}
+
+def save_to_csv(data: Dict[str, List[Any]], filename: str, fieldnames: List[str]):
     try:
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(data)
-        print(f"Successfully generated {filename} with {len(data)} records!")
+        if pa is not None:
+            # Arrow formats the columns in C instead of formatting each row in Python
+            pa_csv.write_csv(pa.table({field: data[field] for field in fieldnames}), filename)
+        else:
+            # Object columns keep integers with missing values from turning into floats
+            pd.DataFrame(
+                {field: pd.Series(data[field], dtype=object) for field in fieldnames}
+            ).to_csv(filename, index=False)
+        print(f"Successfully generated {filename} with {len(data[fieldnames[0]])} records!")
     except Exception as e:
         print(f"An error occurred while saving {filename}: {str(e)}")
 
@@ -288,10 +468,6 @@ def main():
     employee_generator = EmployeeGenerator()
     employees = employee_generator.generate_employees(num_employees)
 
-    # Remove duplicate employee IDs if any
-    unique_employees = {emp['employee_id']: emp for emp in employees}.values()
-    employees = list(unique_employees)
-
     # Save employee data
     employee_headers = [
         'employee_id', 'first_name', 'last_name', 'designation', 'department',
@@ -302,12 +478,7 @@ def main():
     save_to_csv(employees, 'psu_employees.csv', employee_headers)
 
     # Generate and save pay structure data
-    pay_generator = PayStructureGenerator()
-    pay_structures = [pay_generator.generate_pay_structure(emp) for emp in employees]
-
-    # Remove duplicates from pay structure data
-    unique_pay_structures = {ps['employee_id']: ps for ps in pay_structures}.values()
-    pay_structures = list(unique_pay_structures)
+    pay_structures = generate_pay_structures_parallel(employees, os.cpu_count() or 1)
 
     pay_headers = [
         'pay_id', 'employee_id', 'base_salary', 'ta', 'da', 'hra',